@@ -6,71 +6,197 @@ and lets you view details and delete them safely.
 """
 
 import os
+import re
 import sys
-import json
-import subprocess
+import fnmatch
+import time
 import asyncio
 import shutil
+import concurrent.futures
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QSplitter,
     QFormLayout, QTableView, QMessageBox, QLineEdit, QLabel,
     QToolBar, QStatusBar, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, QSortFilterProxyModel
+from PySide6.QtCore import Qt, QAbstractTableModel, QMetaObject, QModelIndex, QTimer, Q_ARG
 from PySide6.QtGui import QIcon, QAction
 
 import qasync
 
+# orjson parses conda's JSON output faster; fall back to the standard library.
+try:
+    import orjson as _json_lib
+except ImportError:
+    import json as _json_lib
+
 # -----------------------------------------------------------------------------
 # Data structure representing a Python virtual environment.
 # -----------------------------------------------------------------------------
-@dataclass
+Deleter = Callable[["Environment"], Awaitable[Tuple[bool, str]]]
+
+@dataclass(slots=True)
 class Environment:
     name: str
     env_type: str
     path: str
+    # Coroutine function that removes this environment, chosen from env_type.
+    deleter: Optional[Deleter] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.deleter is None:
+            self.deleter = _DELETERS.get(self.env_type, _delete_fs)
 
 # -----------------------------------------------------------------------------
 # Table model for displaying environments.
 # -----------------------------------------------------------------------------
 class EnvTableModel(QAbstractTableModel):
+    """Table of environments that also does its own filtering and sorting.
+
+    Rows shown by the view are the source rows listed in self._visible, so
+    no QSortFilterProxyModel sits between the model and the view.
+    """
     def __init__(self, environments: List[Environment] = None):
         super().__init__()
-        self.environments = environments or []
+        self.environments = list(environments or [])
+        self._rows = self._build_rows(self.environments)
+        self._filter_match = None
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._visible = self._compute_visible(self._rows)
         self.headers = ["Name", "Type", "Path"]
 
+    @staticmethod
+    def _build_rows(environments: List[Environment]) -> List[Tuple[str, str, str]]:
+        # Flattened per-row display values, indexed directly by data().
+        return [(env.name, env.env_type, env.path) for env in environments]
+
+    def _compute_visible(self, rows: List[Tuple[str, str, str]]) -> List[int]:
+        """Return the indices of rows that pass the filter, in display order."""
+        match = self._filter_match
+        if match is None:
+            visible = list(range(len(rows)))
+        else:
+            visible = [i for i, row in enumerate(rows) if match(row[0])]
+        if self._sort_column >= 0:
+            column = self._sort_column
+            visible.sort(key=lambda i: rows[i][column], reverse=self._sort_order == Qt.DescendingOrder)
+        return visible
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self.environments)
+        return 0 if parent.isValid() else len(self._visible)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self.headers)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
-        env = self.environments[index.row()]
-        if role == Qt.DisplayRole:
-            if index.column() == 0:
-                return env.name
-            elif index.column() == 1:
-                return env.env_type
-            elif index.column() == 2:
-                return env.path
-        return None
+        return self._rows[self._visible[index.row()]][index.column()]
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
             return self.headers[section]
         return super().headerData(section, orientation, role)
 
+    def env_at(self, row: int) -> Environment:
+        """Return the environment shown at the given view row."""
+        return self.environments[self._visible[row]]
+
+    def set_filter(self, text: str):
+        """Show only environments whose name matches the wildcard text (case-insensitive)."""
+        if text:
+            self._filter_match = re.compile(fnmatch.translate(f"*{text}*"), re.IGNORECASE).match
+        else:
+            self._filter_match = None
+        self._apply_visible(self.environments, self._rows, self._compute_visible(self._rows))
+
+    def _emit(self, signal: str, *args):
+        # Emitting through the meta-object system rather than Signal.emit(): with
+        # PySide6 6.12 every Python-side emit drops a reference to True, which
+        # eventually aborts the interpreter after a few hundred sorts/refreshes.
+        QMetaObject.invokeMethod(self, signal, Qt.DirectConnection, *args)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._emit("layoutAboutToBeChanged")
+        persistent = self.persistentIndexList()
+        old_paths = [self._rows[self._visible[index.row()]][2] for index in persistent]
+        self._visible = self._compute_visible(self._rows)
+        new_row = {self._rows[i][2]: row for row, i in enumerate(self._visible)}
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_row[path], index.column()) for path, index in zip(old_paths, persistent)]
+        )
+        self._emit("layoutChanged")
+
+    def _apply_visible(self, environments: List[Environment], rows: List[Tuple[str, str, str]],
+                       new_visible: List[int]):
+        """Switch to new source data and visible rows using row removals and insertions."""
+        old_paths = [self._rows[i][2] for i in self._visible]
+        new_paths = [rows[i][2] for i in new_visible]
+        old_set = set(old_paths)
+        new_set = set(new_paths)
+        if [p for p in old_paths if p in new_set] != [p for p in new_paths if p in old_set]:
+            # Rows that stay visible changed relative order; fall back to a reset.
+            self.beginResetModel()
+            self.environments, self._rows, self._visible = environments, rows, new_visible
+            self.endResetModel()
+            return
+
+        # Remove contiguous runs of rows against the old data, starting from the
+        # bottom so indices stay valid.
+        removed_rows = [row for row, p in enumerate(old_paths) if p not in new_set]
+        i = len(removed_rows) - 1
+        while i >= 0:
+            last = first = removed_rows[i]
+            i -= 1
+            while i >= 0 and removed_rows[i] == first - 1:
+                first = removed_rows[i]
+                i -= 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._visible[first:last + 1]
+            self.endRemoveRows()
+
+        # Only rows present in both lists remain, so re-point them at the new data.
+        source_row = {row[2]: i for i, row in enumerate(rows)}
+        self._visible = [source_row[self._rows[i][2]] for i in self._visible]
+        self.environments, self._rows = environments, rows
+
+        # Insert contiguous runs of new rows, top to bottom.
+        row = 0
+        while row < len(new_paths):
+            if new_paths[row] in old_set:
+                row += 1
+                continue
+            first = row
+            while row < len(new_paths) and new_paths[row] not in old_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._visible[first:first] = new_visible[first:row]
+            self.endInsertRows()
+
     def update_data(self, environments: List[Environment]):
-        self.beginResetModel()
-        self.environments = environments
-        self.endResetModel()
+        """Apply a new environment list as row removals, insertions and in-place changes.
+
+        Unlike a full model reset this keeps the view's selection and sort state.
+        """
+        old_rows = {row[2]: row for row in self._rows}
+        environments = list(environments)
+        rows = self._build_rows(environments)
+        self._apply_visible(environments, rows, self._compute_visible(rows))
+
+        # Refresh rows whose details changed for an existing path.
+        last_column = len(self.headers) - 1
+        for row, i in enumerate(self._visible):
+            old_row = old_rows.get(self._rows[i][2])
+            if old_row is not None and old_row != self._rows[i]:
+                self._emit("dataChanged", Q_ARG(QModelIndex, self.index(row, 0)),
+                           Q_ARG(QModelIndex, self.index(row, last_column)))
 
 # -----------------------------------------------------------------------------
 # Details panel for a selected environment.
@@ -111,20 +237,27 @@ class MainWindow(QMainWindow):
         # Setup toolbar.
         self.toolbar = QToolBar("Main Toolbar")
         self.addToolBar(self.toolbar)
-        # Refresh action.
-        refresh_action = QAction(QIcon.fromTheme("view-refresh"), "Refresh", self)
-        refresh_action.triggered.connect(self.on_refresh_clicked)
-        self.toolbar.addAction(refresh_action)
+        # Refresh action (icons are resolved lazily in showEvent).
+        self.refresh_action = QAction("Refresh", self)
+        self.refresh_action.triggered.connect(self.on_refresh_clicked)
+        self.toolbar.addAction(self.refresh_action)
         # Delete action.
-        delete_action = QAction(QIcon.fromTheme("edit-delete"), "Delete", self)
-        delete_action.triggered.connect(self.on_delete_clicked)
-        self.toolbar.addAction(delete_action)
+        self.delete_action = QAction("Delete", self)
+        self.delete_action.triggered.connect(self.on_delete_clicked)
+        self.toolbar.addAction(self.delete_action)
+        self._icons_loaded = False
         # Spacer and search.
         self.toolbar.addSeparator()
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search environments...")
         self.search_edit.textChanged.connect(self.on_search_changed)
         self.toolbar.addWidget(self.search_edit)
+        # Debounce filtering so a burst of keystrokes triggers a single refilter.
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
 
         # Setup status bar.
         self.status_bar = QStatusBar()
@@ -136,11 +269,8 @@ class MainWindow(QMainWindow):
 
         # Left side: table view.
         self.env_table_model = EnvTableModel()
-        self.proxy_model = QSortFilterProxyModel()
-        self.proxy_model.setSourceModel(self.env_table_model)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
         self.table_view = QTableView()
-        self.table_view.setModel(self.proxy_model)
+        self.table_view.setModel(self.env_table_model)
         self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table_view.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table_view.horizontalHeader().setStretchLastSection(True)
@@ -158,15 +288,25 @@ class MainWindow(QMainWindow):
         # Schedule initial refresh after event loop starts.
         QTimer.singleShot(0, lambda: asyncio.create_task(self.refresh_environments()))
 
+    def showEvent(self, event):
+        # Theme icon lookups walk the icon theme index, so defer them until first shown.
+        if not self._icons_loaded:
+            self.refresh_action.setIcon(QIcon.fromTheme("view-refresh"))
+            self.delete_action.setIcon(QIcon.fromTheme("edit-delete"))
+            self._icons_loaded = True
+        super().showEvent(event)
+
     def on_search_changed(self, text: str):
-        self.proxy_model.setFilterWildcard(text)
+        self._pending_filter = text
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        self.env_table_model.set_filter(self._pending_filter)
 
     def on_selection_changed(self):
         indexes = self.table_view.selectionModel().selectedRows()
         if indexes:
-            # Get the source model index.
-            source_index = self.proxy_model.mapToSource(indexes[0])
-            env = self.env_table_model.environments[source_index.row()]
+            env = self.env_table_model.env_at(indexes[0].row())
             self.details_panel.update_details(env)
         else:
             self.details_panel.clear_details()
@@ -181,10 +321,7 @@ class MainWindow(QMainWindow):
     async def refresh_environments(self):
         self.status_bar.showMessage("Scanning for environments...")
         try:
-            envs = await scan_all_environments()
-            # Remove duplicates by path.
-            unique = {env.path: env for env in envs}.values()
-            self.all_envs = list(unique)
+            self.all_envs = await scan_all_environments()
             self.env_table_model.update_data(self.all_envs)
             self.status_bar.showMessage(f"Found {len(self.all_envs)} environments.", 5000)
         except Exception as exc:
@@ -195,9 +332,7 @@ class MainWindow(QMainWindow):
         if not indexes:
             QMessageBox.warning(self, "No Selection", "Please select an environment to delete.")
             return
-        # Map proxy index to source index.
-        source_index = self.proxy_model.mapToSource(indexes[0])
-        env = self.env_table_model.environments[source_index.row()]
+        env = self.env_table_model.env_at(indexes[0].row())
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
@@ -220,6 +355,20 @@ class MainWindow(QMainWindow):
 # -----------------------------------------------------------------------------
 # Asynchronous scanning functions.
 # -----------------------------------------------------------------------------
+# Scan roots, computed once at import instead of on every refresh.
+_HOME = Path.home()
+_VENV_ROOTS = (
+    _HOME / ".virtualenvs",
+    _HOME / ".cache" / "pypoetry" / "virtualenvs",
+    _HOME / ".local" / "share" / "virtualenvs",
+)
+_CONDA_ROOTS = (
+    _HOME / "miniconda3" / "envs",
+    _HOME / "anaconda3" / "envs",
+    _HOME / ".conda" / "envs",
+)
+_CONDA_REGISTRY = _HOME / ".conda" / "environments.txt"
+
 async def scan_all_environments() -> List[Environment]:
     results = await asyncio.gather(
         scan_venv_dirs(),
@@ -227,73 +376,207 @@ async def scan_all_environments() -> List[Environment]:
         scan_current_dir_venv(),
         return_exceptions=True
     )
+    # Scan roots can overlap, so drop duplicate paths while collecting.
     envs: List[Environment] = []
+    seen: Set[str] = set()
     for result in results:
         if isinstance(result, Exception):
             print("Error in scanning:", result)
+            continue
+        for env in result:
+            if env.path not in seen:
+                seen.add(env.path)
+                envs.append(env)
+    return envs
+
+def _env_path(base_abs: str, name: str, is_symlink: bool) -> str:
+    """Return the absolute path of base_abs/name, only resolving it when it is a symlink."""
+    path = os.path.join(base_abs, name)
+    return os.path.realpath(path) if is_symlink else path
+
+def _classify(entry_path: str) -> Optional[str]:
+    """Return "venv" or "Conda" if entry_path looks like an environment root, else None.
+
+    Reads the directory once and stops at the first marker, instead of
+    stat-ing each marker path separately.
+    """
+    try:
+        with os.scandir(entry_path) as it:
+            for child in it:
+                name = child.name
+                if name == "pyvenv.cfg":
+                    return "venv"
+                if name == "conda-meta" and child.is_dir(follow_symlinks=False):
+                    return "Conda"
+    except OSError:
+        pass
+    return None
+
+def _is_conda_env(env_dir: str) -> bool:
+    """Return True if env_dir has a conda-meta directory or a bin/python interpreter."""
+    bin_dir = None
+    try:
+        with os.scandir(env_dir) as it:
+            for child in it:
+                if child.name == "conda-meta" and child.is_dir(follow_symlinks=False):
+                    return True
+                if child.name == "bin" and child.is_dir():
+                    bin_dir = child.path
+    except OSError:
+        return False
+    return bin_dir is not None and os.path.exists(os.path.join(bin_dir, "python"))
+
+def _scan_venv_base(base: Path) -> List[Environment]:
+    """Scan a single base directory for venv/virtualenv (and uv) environments."""
+    envs: List[Environment] = []
+    if base.is_dir():
+        try:
+            etype = "Poetry" if "pypoetry" in str(base) else "Pipenv" if "local" in str(base) else "venv"
+            base_abs = str(base.resolve())
+            with os.scandir(base) as it:
+                for entry in it:
+                    # A single stat of the marker file also rules out non-directory entries.
+                    try:
+                        os.stat(os.path.join(entry.path, "pyvenv.cfg"))
+                    except OSError:
+                        continue
+                    path = _env_path(base_abs, entry.name, entry.is_symlink())
+                    envs.append(Environment(name=entry.name, env_type=etype, path=path))
+        except Exception as exc:
+            print(f"Error scanning {base}: {exc}")
+    return envs
+
+def _scan_conda_base(base: Path) -> List[Environment]:
+    """Scan a single known directory for Conda environments."""
+    envs: List[Environment] = []
+    if base.is_dir():
+        try:
+            base_abs = str(base.resolve())
+            with os.scandir(base) as it:
+                for entry in it:
+                    if _is_conda_env(entry.path):
+                        path = _env_path(base_abs, entry.name, entry.is_symlink())
+                        envs.append(Environment(name=entry.name, env_type="Conda", path=path))
+        except Exception as exc:
+            print(f"Error scanning {base}: {exc}")
+    return envs
+
+# Results of the per-base scanners, keyed by base directory and validated
+# against the mtimes of the directory and its children so that repeated
+# refreshes skip unchanged trees.
+_scan_cache: Dict[str, Tuple[tuple, List[Environment]]] = {}
+
+# Results whose tree changed this recently are not cached, since filesystems
+# with coarse timestamps could hide a further change within the same tick.
+_RACY_WINDOW_NS = 2_000_000_000
+
+def _tree_signature(base: Path, probes: Tuple[str, ...]) -> tuple:
+    """Return the mtimes of base, each child and each child's probe subdirectories.
+
+    Adding or removing a marker (pyvenv.cfg, conda-meta) changes its child's
+    mtime and changing bin/python changes bin's, so the signature covers
+    every way an entry can start or stop being an environment.
+    """
+    signature = [("", os.stat(base).st_mtime_ns)]
+    with os.scandir(base) as it:
+        for entry in it:
+            try:
+                signature.append((entry.name, entry.stat().st_mtime_ns))
+            except OSError:
+                signature.append((entry.name, None))
+            for probe in probes:
+                try:
+                    signature.append((entry.name + "/" + probe, os.stat(os.path.join(entry.path, probe)).st_mtime_ns))
+                except OSError:
+                    pass
+    return tuple(sorted(signature))
+
+def _scan_base_cached(scan_base, base: Path, probes: Tuple[str, ...] = ()) -> List[Environment]:
+    """Return scan_base(base), reusing the previous result while base's tree signature is unchanged."""
+    key = str(base)
+    started = time.time_ns()
+    try:
+        signature = _tree_signature(base, probes)
+    except OSError:
+        _scan_cache.pop(key, None)
+        return []
+    cached = _scan_cache.get(key)
+    if cached and cached[0] == signature:
+        return list(cached[1])
+    envs = scan_base(base)
+    if max(mtime for _, mtime in signature if mtime is not None) < started - _RACY_WINDOW_NS:
+        _scan_cache[key] = (signature, envs)
+    else:
+        _scan_cache.pop(key, None)
+    return list(envs)
+
+async def _scan_bases_concurrently(scan_base, bases: Sequence[Path],
+                                   probes: Tuple[str, ...] = ()) -> List[Environment]:
+    """Run scan_base on each base directory in its own thread so the disk I/O overlaps."""
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_scan_base_cached, scan_base, base, probes) for base in bases),
+        return_exceptions=True
+    )
+    envs: List[Environment] = []
+    for base, result in zip(bases, results):
+        if isinstance(result, Exception):
+            print(f"Error scanning {base}: {result}")
         else:
             envs.extend(result)
     return envs
 
 async def scan_venv_dirs() -> List[Environment]:
     """Scan common directories for venv/virtualenv (and uv) environments."""
-    def blocking_scan() -> List[Environment]:
-        envs: List[Environment] = []
-        home = Path.home()
-        paths = [
-            home / ".virtualenvs",
-            home / ".cache" / "pypoetry" / "virtualenvs",
-            home / ".local" / "share" / "virtualenvs",
-            ]
-        for base in paths:
-            if base.is_dir():
-                try:
-                    for entry in base.iterdir():
-                        if entry.is_dir() and (entry / "pyvenv.cfg").exists():
-                            etype = "Poetry" if "pypoetry" in str(base) else "Pipenv" if "local" in str(base) else "venv"
-                            envs.append(Environment(name=entry.name, env_type=etype, path=str(entry.resolve())))
-                except Exception as exc:
-                    print(f"Error scanning {base}: {exc}")
-        return envs
-    return await asyncio.to_thread(blocking_scan)
+    return await _scan_bases_concurrently(_scan_venv_base, _VENV_ROOTS)
 
 async def scan_conda_envs() -> List[Environment]:
-    """Scan for Conda environments via CLI; if missing, scan known directories."""
-    def blocking_conda_scan() -> List[Environment]:
+    """Scan for Conda environments via conda's registry file plus the known envs directories.
+
+    Without a registry, fall back to the conda CLI, or to the known directories alone.
+    """
+    def blocking_registry_scan() -> Optional[List[Environment]]:
+        # Conda records every environment it creates in this registry, so reading
+        # it avoids spawning the (slow to start) conda CLI.
+        registry = _CONDA_REGISTRY
+        if not registry.exists():
+            return None
         envs: List[Environment] = []
-        conda_path = shutil.which("conda")
-        if conda_path:
-            try:
-                result = subprocess.run(
-                    [conda_path, "env", "list", "--json"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=True
-                )
-                data = json.loads(result.stdout)
-                for path in data.get("envs", []):
+        try:
+            for line in registry.read_text().splitlines():
+                path = line.strip()
+                if path and _classify(path) == "Conda":
                     envs.append(Environment(name=Path(path).name, env_type="Conda", path=path))
-            except Exception as exc:
-                print("Error scanning Conda via CLI:", exc)
-        else:
-            print("Conda CLI not found; performing manual scan.")
-            known_dirs = [
-                Path.home() / "miniconda3" / "envs",
-                Path.home() / "anaconda3" / "envs",
-                Path.home() / ".conda" / "envs"
-            ]
-            for base in known_dirs:
-                if base.is_dir():
-                    try:
-                        for env_dir in base.iterdir():
-                            if env_dir.is_dir():
-                                if (env_dir / "conda-meta").is_dir() or (env_dir / "bin" / "python").exists():
-                                    envs.append(Environment(name=env_dir.name, env_type="Conda", path=str(env_dir.resolve())))
-                    except Exception as exc:
-                        print(f"Error scanning {base}: {exc}")
+        except Exception as exc:
+            print(f"Error reading {registry}: {exc}")
+        return envs
+    # Environments missing from the per-user registry (registration disabled,
+    # created by another user or an old conda) still live in the envs dirs.
+    envs, dir_envs = await asyncio.gather(
+        asyncio.to_thread(blocking_registry_scan),
+        _scan_bases_concurrently(_scan_conda_base, _CONDA_ROOTS, probes=("bin",))
+    )
+    if envs is not None:
+        return envs + dir_envs
+    conda_path = shutil.which("conda")
+    if conda_path:
+        envs = []
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                conda_path, "env", "list", "--json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                raise RuntimeError(stderr.decode(errors="replace").strip() or f"exit status {proc.returncode}")
+            data = _json_lib.loads(stdout)
+            for path in data.get("envs", []):
+                envs.append(Environment(name=Path(path).name, env_type="Conda", path=path))
+        except Exception as exc:
+            print("Error scanning Conda via CLI:", exc)
         return envs
-    return await asyncio.to_thread(blocking_conda_scan)
+    print("Conda registry and CLI not found; using the manual scan only.")
+    return dir_envs
 
 async def scan_current_dir_venv() -> List[Environment]:
     """Check the current directory for an in-project '.venv' environment."""
@@ -301,48 +584,85 @@ async def scan_current_dir_venv() -> List[Environment]:
         envs: List[Environment] = []
         cwd = Path.cwd()
         potential = cwd / ".venv"
-        if potential.is_dir() and (potential / "pyvenv.cfg").exists():
-            envs.append(Environment(name=cwd.name, env_type="venv (local)", path=str(potential.resolve())))
+        if _classify(str(potential)) == "venv":
+            # Path.cwd() is already absolute, so only a symlinked .venv needs resolving.
+            path = str(potential.resolve()) if potential.is_symlink() else str(potential)
+            envs.append(Environment(name=cwd.name, env_type="venv (local)", path=path))
         return envs
     return await asyncio.to_thread(blocking_scan)
 
 # -----------------------------------------------------------------------------
 # Environment deletion (with safety checks).
 # -----------------------------------------------------------------------------
+# The running environment never changes, so resolve it once at import time. Use
+# sys.prefix rather than sys.executable: a venv's bin/python is usually a symlink
+# to the base interpreter, so resolving the executable leaves the venv.
+_RUNNING_PREFIX = os.path.realpath(sys.prefix)
+
 def is_current_env(env_path: str) -> bool:
-    """Return True if env_path is the one running this application."""
+    """Return True if env_path is (or contains) the environment running this application."""
     try:
-        return Path(sys.executable).resolve().as_posix().startswith(Path(env_path).resolve().as_posix())
-    except (OSError, RuntimeError):
+        env_real = os.path.realpath(env_path)
+    except OSError:
         return False
+    # The trailing separator keeps e.g. /home/u/venv from matching /home/u/venv2.
+    return env_real == _RUNNING_PREFIX or _RUNNING_PREFIX.startswith(env_real + os.sep)
+
+def _list_tree_top(path: str) -> Tuple[List[str], List[str]]:
+    """Split the direct children of path into (subdirectories, other entries)."""
+    if os.path.islink(path):
+        raise OSError(f"Cannot delete a symbolic link: {path}")
+    subdirs: List[str] = []
+    files: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            (subdirs if entry.is_dir(follow_symlinks=False) else files).append(entry.path)
+    return subdirs, files
+
+def _remove_files_and_dir(path: str, files: List[str]) -> None:
+    for file in files:
+        os.unlink(file)
+    os.rmdir(path)
+
+async def _parallel_rmtree(path: str) -> None:
+    """Remove path like shutil.rmtree, deleting its top-level subdirectories concurrently."""
+    subdirs, files = await asyncio.to_thread(_list_tree_top, path)
+    await asyncio.gather(*(asyncio.to_thread(shutil.rmtree, subdir) for subdir in subdirs))
+    await asyncio.to_thread(_remove_files_and_dir, path, files)
+
+async def _delete_conda(env: Environment) -> Tuple[bool, str]:
+    if env.name.lower() == "base":
+        return False, "Cannot delete the Conda base environment."
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "conda", "env", "remove", "--prefix", env.path, "-y",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            message = stderr.decode(errors="replace").strip() or f"exit status {proc.returncode}"
+            return False, f"Error deleting Conda environment: {message}"
+        return True, "Conda environment removed successfully."
+    except Exception as exc:
+        return False, f"Error deleting Conda environment: {exc}"
+
+async def _delete_fs(env: Environment) -> Tuple[bool, str]:
+    try:
+        await _parallel_rmtree(env.path)
+        return True, "Environment removed successfully."
+    except Exception as exc:
+        return False, f"Error deleting environment: {exc}"
+
+# Deleter bound to each Environment by env_type; anything else is removed from disk.
+_DELETERS: Dict[str, Deleter] = {
+    "Conda": _delete_conda,
+}
 
 async def delete_environment(env: Environment) -> Tuple[bool, str]:
     if is_current_env(env.path):
         return False, "Cannot delete the environment currently in use."
-    if env.env_type == "Conda":
-        if env.name.lower() == "base":
-            return False, "Cannot delete the Conda base environment."
-        def blocking_delete() -> Tuple[bool, str]:
-            try:
-                subprocess.run(
-                    ["conda", "env", "remove", "--prefix", env.path, "-y"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=True
-                )
-                return True, "Conda environment removed successfully."
-            except Exception as exc:
-                return False, f"Error deleting Conda environment: {exc}"
-        return await asyncio.to_thread(blocking_delete)
-    else:
-        def blocking_delete() -> Tuple[bool, str]:
-            try:
-                shutil.rmtree(env.path)
-                return True, "Environment removed successfully."
-            except Exception as exc:
-                return False, f"Error deleting environment: {exc}"
-        return await asyncio.to_thread(blocking_delete)
+    return await env.deleter(env)
 
 # -----------------------------------------------------------------------------
 # Main entry point.
@@ -353,6 +673,10 @@ def main():
     app = QApplication(sys.argv)
     loop = qasync.QEventLoop(app)
     asyncio.set_event_loop(loop)
+    # Dedicated pool for the blocking scan and delete work so the per-directory
+    # fan-out gets predictable concurrency. On network filesystems, where each
+    # stat is slow, raising max_workers can help.
+    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)))
     main_win = MainWindow()
     main_win.show()
     with loop:
@@ -1,4 +1,7 @@
 import os
+import venv
+import asyncio
+import subprocess
 from pathlib import Path
 import shutil  # Required for monkeypatching
 
@@ -11,8 +14,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 # Set Qt to use offscreen rendering for headless CI.
 os.environ["QT_QPA_PLATFORM"] = "offscreen"
 
+from PySide6.QtCore import Qt
+
+import env_manager
 from env_manager import (
     Environment,
+    EnvTableModel,
     scan_venv_dirs,
     scan_current_dir_venv,
     scan_conda_envs,
@@ -20,6 +27,20 @@ from env_manager import (
     delete_environment,
 )
 
+def patch_home(monkeypatch, home: Path):
+    """Point the scan roots, which are computed at import time, at a fake home."""
+    monkeypatch.setattr(env_manager, "_VENV_ROOTS", (
+        home / ".virtualenvs",
+        home / ".cache" / "pypoetry" / "virtualenvs",
+        home / ".local" / "share" / "virtualenvs",
+    ))
+    monkeypatch.setattr(env_manager, "_CONDA_ROOTS", (
+        home / "miniconda3" / "envs",
+        home / "anaconda3" / "envs",
+        home / ".conda" / "envs",
+    ))
+    monkeypatch.setattr(env_manager, "_CONDA_REGISTRY", home / ".conda" / "environments.txt")
+
 # ----------------------------------------------------------------------
 # Test scanning for standard virtual environments (venv/virtualenv)
 # ----------------------------------------------------------------------
@@ -34,8 +55,8 @@ async def test_scan_venv_dirs(tmp_path, monkeypatch):
     fake_venv_dir.mkdir()
     (fake_venv_dir / "pyvenv.cfg").write_text("home = /usr/bin")
 
-    # Monkey-patch Path.home() to return tmp_path.
-    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    # Point the scan roots at tmp_path.
+    patch_home(monkeypatch, tmp_path)
 
     envs = await scan_venv_dirs()
 
@@ -43,6 +64,61 @@ async def test_scan_venv_dirs(tmp_path, monkeypatch):
     names = [env.name for env in envs]
     assert fake_venv_dir.name in names
 
+# ----------------------------------------------------------------------
+# Test that cached scans notice markers added to or removed from existing children.
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_scan_venv_dirs_cache_tracks_markers(tmp_path, monkeypatch):
+    fake_virtualenvs = tmp_path / ".virtualenvs"
+    fake_virtualenvs.mkdir()
+    first = fake_virtualenvs / "first"
+    first.mkdir()
+    (first / "pyvenv.cfg").write_text("home = /usr/bin")
+    newenv = fake_virtualenvs / "newenv"
+    newenv.mkdir()
+
+    # Age the tree so the result is old enough to be cached.
+    for path in (first, newenv, fake_virtualenvs):
+        os.utime(path, ns=(10**9, 10**9))
+
+    patch_home(monkeypatch, tmp_path)
+
+    # Count real scans of the base directory.
+    scanned = []
+    real_scan = env_manager._scan_venv_base
+
+    def counting_scan(base):
+        if base == fake_virtualenvs:
+            scanned.append(base)
+        return real_scan(base)
+    monkeypatch.setattr(env_manager, "_scan_venv_base", counting_scan)
+
+    envs = await scan_venv_dirs()
+    assert [env.name for env in envs] == ["first"]
+    assert str(fake_virtualenvs) in env_manager._scan_cache
+    assert len(scanned) == 1
+
+    # An unchanged tree is served from the cache without rescanning.
+    envs = await scan_venv_dirs()
+    assert [env.name for env in envs] == ["first"]
+    assert len(scanned) == 1
+
+    # Writing the marker into an existing child leaves the base's mtime alone.
+    (newenv / "pyvenv.cfg").write_text("home = /usr/bin")
+    os.utime(newenv, ns=(2 * 10**9, 2 * 10**9))
+    assert fake_virtualenvs.stat().st_mtime_ns == 10**9
+
+    envs = await scan_venv_dirs()
+    assert sorted(env.name for env in envs) == ["first", "newenv"]
+    assert len(scanned) == 2
+
+    # Removing the marker again drops the entry.
+    (newenv / "pyvenv.cfg").unlink()
+    os.utime(newenv, ns=(3 * 10**9, 3 * 10**9))
+
+    envs = await scan_venv_dirs()
+    assert [env.name for env in envs] == ["first"]
+
 # ----------------------------------------------------------------------
 # Test scanning for in-project virtual environment (.venv)
 # ----------------------------------------------------------------------
@@ -76,6 +152,31 @@ def test_is_current_env(tmp_path):
     result = is_current_env(str(fake_env))
     assert result is False
 
+def test_is_current_env_ignores_sibling_prefix(tmp_path, monkeypatch):
+    monkeypatch.setattr(env_manager, "_RUNNING_PREFIX", str(tmp_path.resolve() / "venv2"))
+
+    # A directory whose name is only a prefix of the running env must not match.
+    assert is_current_env(str(tmp_path / "venv")) is False
+    assert is_current_env(str(tmp_path / "venv2")) is True
+
+def test_is_current_env_inside_venv(tmp_path):
+    # A real venv layout, where bin/python is a symlink to the base interpreter.
+    fake_env = tmp_path / "running_env"
+    venv.create(fake_env, system_site_packages=True, symlinks=True)
+    python = fake_env / "bin" / "python"
+    assert python.is_symlink()
+
+    # Ask the venv's own interpreter whether it considers its env current.
+    result = subprocess.run(
+        [str(python), "-c", "import sys, env_manager; print(env_manager.is_current_env(sys.argv[1]))", str(fake_env)],
+        cwd=Path(__file__).resolve().parent,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parent)},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert result.stdout.strip() == "True"
+
 # ----------------------------------------------------------------------
 # Test deletion of a virtual environment.
 # ----------------------------------------------------------------------
@@ -85,6 +186,11 @@ async def test_delete_environment(tmp_path):
     fake_env = tmp_path / "env_to_delete"
     fake_env.mkdir()
     (fake_env / "pyvenv.cfg").write_text("home = /usr/bin")
+    site_packages = fake_env / "lib" / "python3" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (site_packages / "module.py").write_text("")
+    (fake_env / "bin").mkdir()
+    (fake_env / "bin" / "python").symlink_to("/usr/bin/python3")
     env = Environment(name="env_to_delete", env_type="venv", path=str(fake_env.resolve()))
 
     # Ensure the directory exists before deletion.
@@ -94,6 +200,110 @@ async def test_delete_environment(tmp_path):
     assert success, f"Deletion failed: {message}"
     assert not fake_env.exists()
 
+# ----------------------------------------------------------------------
+# Test that environments missing from the registry are still found.
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_scan_conda_envs_registry_and_known_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda x: None)
+
+    # The registry only lists a stale entry.
+    registry = tmp_path / ".conda" / "environments.txt"
+    registry.parent.mkdir()
+    registry.write_text(f"{tmp_path / 'envs' / 'removed_env'}\n")
+
+    # This environment was never registered.
+    unregistered = tmp_path / "miniconda3" / "envs" / "unregistered_env"
+    (unregistered / "conda-meta").mkdir(parents=True)
+
+    patch_home(monkeypatch, tmp_path)
+
+    envs = await scan_conda_envs()
+
+    names = [env.name for env in envs]
+    assert names == ["unregistered_env"]
+
+# ----------------------------------------------------------------------
+# Test the conda CLI fallback and Conda deletion with a stubbed subprocess.
+# ----------------------------------------------------------------------
+class FakeProcess:
+    def __init__(self, returncode: int, stdout: bytes = b"", stderr: bytes = b""):
+        self.returncode = returncode
+        self._output = (stdout, stderr)
+
+    async def communicate(self):
+        return self._output
+
+def patch_subprocess(monkeypatch, process: FakeProcess) -> list:
+    """Make asyncio.create_subprocess_exec return process, recording its arguments."""
+    calls = []
+
+    async def fake_exec(*args, **kwargs):
+        calls.append(args)
+        return process
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+    return calls
+
+@pytest.mark.asyncio
+async def test_scan_conda_envs_cli(tmp_path, monkeypatch):
+    # No registry under the fake home, but a conda CLI on PATH.
+    patch_home(monkeypatch, tmp_path)
+    monkeypatch.setattr(shutil, "which", lambda x: "/usr/bin/conda")
+    calls = patch_subprocess(monkeypatch, FakeProcess(0, b'{"envs": ["/opt/conda", "/opt/conda/envs/ml"]}'))
+
+    envs = await scan_conda_envs()
+
+    assert calls == [("/usr/bin/conda", "env", "list", "--json")]
+    assert [(env.name, env.env_type, env.path) for env in envs] == [
+        ("conda", "Conda", "/opt/conda"),
+        ("ml", "Conda", "/opt/conda/envs/ml"),
+    ]
+
+@pytest.mark.asyncio
+async def test_scan_conda_envs_cli_failure(tmp_path, monkeypatch):
+    patch_home(monkeypatch, tmp_path)
+    monkeypatch.setattr(shutil, "which", lambda x: "/usr/bin/conda")
+    patch_subprocess(monkeypatch, FakeProcess(1, stderr=b"CondaError: broken"))
+
+    assert await scan_conda_envs() == []
+
+@pytest.mark.asyncio
+async def test_delete_conda_environment(tmp_path, monkeypatch):
+    env = Environment(name="ml", env_type="Conda", path=str(tmp_path / "envs" / "ml"))
+
+    calls = patch_subprocess(monkeypatch, FakeProcess(0))
+    success, message = await delete_environment(env)
+    assert success, message
+    assert calls == [("conda", "env", "remove", "--prefix", env.path, "-y")]
+
+    # A non-zero exit reports conda's stderr.
+    patch_subprocess(monkeypatch, FakeProcess(2, stderr=b"EnvironmentLocationNotFound\n"))
+    success, message = await delete_environment(env)
+    assert not success
+    assert message == "Error deleting Conda environment: EnvironmentLocationNotFound"
+
+# ----------------------------------------------------------------------
+# Test that each environment type is bound to the right deleter.
+# ----------------------------------------------------------------------
+def test_environment_deleter_dispatch():
+    assert Environment("env", "Conda", "/envs/env").deleter is env_manager._delete_conda
+    assert Environment("env", "Poetry", "/envs/env").deleter is env_manager._delete_fs
+    assert Environment("env", "venv (local)", "/envs/env").deleter is env_manager._delete_fs
+
+# ----------------------------------------------------------------------
+# Test that the Conda base environment is never deleted.
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_delete_environment_refuses_conda_base(tmp_path, monkeypatch):
+    async def fail_exec(*args, **kwargs):
+        raise AssertionError("conda should not be invoked")
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fail_exec)
+
+    env = Environment(name="base", env_type="Conda", path=str(tmp_path / "miniconda3"))
+    success, message = await delete_environment(env)
+    assert not success
+    assert message == "Cannot delete the Conda base environment."
+
 # ----------------------------------------------------------------------
 # Test scanning for Conda environments in manual mode.
 # ----------------------------------------------------------------------
@@ -108,11 +318,89 @@ async def test_scan_conda_envs_manual(tmp_path, monkeypatch):
     # Create a fake conda-meta directory to indicate a Conda environment.
     (fake_conda_env_dir / "conda-meta").mkdir()
 
-    # Set HOME to tmp_path so that our manual scan finds the fake directory.
-    monkeypatch.setenv("HOME", str(tmp_path))
+    # Point the scan roots at tmp_path so that our manual scan finds the fake directory.
+    patch_home(monkeypatch, tmp_path)
 
     envs = await scan_conda_envs()
 
     # Verify that our fake Conda environment is found.
     names = [env.name for env in envs]
     assert "fake_conda_env" in names
+
+# ----------------------------------------------------------------------
+# Test the manual Conda scan's bin/python fallback.
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_scan_conda_envs_manual_bin_python(tmp_path, monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda x: None)
+    envs_dir = tmp_path / "miniconda3" / "envs"
+
+    # Only bin/python, no conda-meta.
+    (envs_dir / "python_only" / "bin").mkdir(parents=True)
+    (envs_dir / "python_only" / "bin" / "python").write_text("")
+    # An empty bin must not hide a conda-meta listed after it.
+    (envs_dir / "empty_bin" / "bin").mkdir(parents=True)
+    (envs_dir / "empty_bin" / "conda-meta").mkdir()
+    # Neither marker.
+    (envs_dir / "not_an_env" / "bin").mkdir(parents=True)
+
+    patch_home(monkeypatch, tmp_path)
+
+    envs = await scan_conda_envs()
+
+    assert sorted(env.name for env in envs) == ["empty_bin", "python_only"]
+
+# ----------------------------------------------------------------------
+# Test scanning for Conda environments via the environments.txt registry.
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_scan_conda_envs_registry(tmp_path, monkeypatch):
+    # The registry should be used even when the conda CLI is available.
+    monkeypatch.setattr(shutil, "which", lambda x: "/usr/bin/conda")
+
+    # Create one real Conda environment and list it alongside a stale entry.
+    fake_conda_env_dir = tmp_path / "envs" / "registered_env"
+    (fake_conda_env_dir / "conda-meta").mkdir(parents=True)
+    registry = tmp_path / ".conda" / "environments.txt"
+    registry.parent.mkdir()
+    registry.write_text(f"{fake_conda_env_dir}\n{tmp_path / 'envs' / 'removed_env'}\n\n")
+
+    patch_home(monkeypatch, tmp_path)
+
+    envs = await scan_conda_envs()
+
+    names = [env.name for env in envs]
+    assert names == ["registered_env"]
+
+# ----------------------------------------------------------------------
+# Test filtering and sorting done by the table model itself.
+# ----------------------------------------------------------------------
+def test_env_table_model_filter_and_sort():
+    model = EnvTableModel()
+    model.update_data([
+        Environment(name="beta", env_type="venv", path="/envs/beta"),
+        Environment(name="Alpha", env_type="Conda", path="/envs/alpha"),
+        Environment(name="gamma", env_type="Poetry", path="/envs/gamma"),
+    ])
+
+    def names():
+        return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+    model.sort(0, Qt.AscendingOrder)
+    assert names() == ["Alpha", "beta", "gamma"]
+
+    # The wildcard matches anywhere in the name, ignoring case.
+    model.set_filter("a*A")
+    assert names() == ["Alpha", "gamma"]
+    assert model.env_at(1).path == "/envs/gamma"
+
+    # New environments are slotted into the filtered, sorted view.
+    model.update_data([
+        Environment(name="gamma", env_type="Poetry", path="/envs/gamma"),
+        Environment(name="panda", env_type="venv", path="/envs/panda"),
+    ])
+    assert names() == ["gamma", "panda"]
+
+    model.set_filter("")
+    model.sort(0, Qt.DescendingOrder)
+    assert names() == ["panda", "gamma"]